@@ -5,6 +5,10 @@ Image editing with multi-image navigation, filter parameters, and aspect-ratio l
 
 import sys
 import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout,
                                QPushButton, QLabel, QSlider, QGroupBox, QGridLayout,
                                QFileDialog, QMessageBox, QSpinBox, QComboBox,
@@ -15,6 +19,44 @@ from PySide6.QtGui import QPixmap, QImage
 from PIL import Image, ImageEnhance, ImageFilter
 import numpy as np
 
+# Number of decoded source images kept for instant reloads when switching back
+DECODE_CACHE_SIZE = 8
+
+# Filters without parameters, by filter combo name; PIL's built-in kernels
+# are shared instances, so nothing is rebuilt per apply
+FIXED_FILTERS = {
+    "Blur": ImageFilter.BLUR,
+    "Sharpen": ImageFilter.SHARPEN,
+    "Edge Enhance": ImageFilter.EDGE_ENHANCE,
+    "Edge Enhance More": ImageFilter.EDGE_ENHANCE_MORE,
+    "Find Edges": ImageFilter.FIND_EDGES,
+    "Emboss": ImageFilter.EMBOSS,
+    "Contour": ImageFilter.CONTOUR,
+    "Detail": ImageFilter.DETAIL,
+    "Smooth": ImageFilter.SMOOTH,
+    "Smooth More": ImageFilter.SMOOTH_MORE,
+}
+
+# Every 8-bit value once, for tabulating per-value enhancements
+_VALUE_RAMP = Image.frombytes('L', (256, 1), bytes(range(256)))
+
+
+@lru_cache(maxsize=64)
+def _brightness_lut(factor):
+    """ImageEnhance.Brightness(factor) of every 8-bit value, as a 256-entry table."""
+    return list(ImageEnhance.Brightness(_VALUE_RAMP).enhance(factor).tobytes())
+
+
+def enhance_brightness(image, factor):
+    """
+    Same result as ImageEnhance.Brightness(image).enhance(factor), via a lookup table.
+
+    Brightness maps each channel value independently, so the enhancement is
+    tabulated once per factor and applied with Image.point instead of
+    blending the whole image against black.
+    """
+    return image.point(_brightness_lut(factor) * len(image.getbands()))
+
 
 class ImageModificationPage(QWidget):
     """
@@ -30,6 +72,9 @@ class ImageModificationPage(QWidget):
         self.modified_image = None
 
         self.max_display_size = (800, 600)
+        # PIL images are never modified in place here (every operation returns
+        # a new image), so history entries, saved states and the working images
+        # share image objects instead of each holding a private copy.
         self.history = []
         self.history_index = -1
 
@@ -49,6 +94,11 @@ class ImageModificationPage(QWidget):
         # Guard against recursive spinbox updates (aspect ratio lock)
         self._updating_spinbox = False
 
+        # (path, mtime) -> decoded RGB image, least recently used first;
+        # Apply-to-All workers share it, so access goes through the lock
+        self._decode_cache = OrderedDict()
+        self._decode_lock = threading.Lock()
+
         self.init_ui()
 
         if image_path:
@@ -590,17 +640,14 @@ class ImageModificationPage(QWidget):
             return
         path = self.image_paths[self.current_index]
         self.image_states[path] = {
-            'original_image': self.original_image.copy() if self.original_image else None,
-            'current_image': self.current_image.copy(),
-            'adjustment_base': self.adjustment_base.copy() if self.adjustment_base else None,
-            'pre_filter_image': self.pre_filter_image.copy() if self.pre_filter_image else None,
-            'pre_filter_adjustment_base': (
-                self.pre_filter_adjustment_base.copy()
-                if self.pre_filter_adjustment_base else None
-            ),
+            'original_image': self.original_image,
+            'current_image': self.current_image,
+            'adjustment_base': self.adjustment_base,
+            'pre_filter_image': self.pre_filter_image,
+            'pre_filter_adjustment_base': self.pre_filter_adjustment_base,
             'active_filter': self.active_filter,
-            'modified_image': self.modified_image.copy() if self.modified_image else None,
-            'history': [h.copy() for h in self.history],
+            'modified_image': self.modified_image,
+            'history': list(self.history),
             'history_index': self.history_index,
             'brightness': self.brightness_slider.value(),
             'contrast': self.contrast_slider.value(),
@@ -695,22 +742,29 @@ class ImageModificationPage(QWidget):
             )
             return
 
+        def render(path):
+            original = self._open_rgb(path)
+            # Apply committed transforms, producing the pre-adjustment base.
+            adj_base = self._replay_ops(original, transform_ops)
+            # Apply current slider values on top to get the final result.
+            result = adj_base
+            if b != 1.0:
+                result = enhance_brightness(result, b)
+            if c != 1.0:
+                result = ImageEnhance.Contrast(result).enhance(c)
+            if s != 1.0:
+                result = ImageEnhance.Sharpness(result).enhance(s)
+            return original, adj_base, result
+
+        # Pillow releases the GIL while decoding and filtering, so the other
+        # images are rendered in parallel; states are stored here in order.
+        other_paths = [path for i, path in enumerate(self.image_paths) if i != self.current_index]
         errors = []
-        for i, path in enumerate(self.image_paths):
-            if i == self.current_index:
-                continue
+        with ThreadPoolExecutor(max_workers=min(len(other_paths), os.cpu_count() or 1)) as pool:
+            futures = [(path, pool.submit(render, path)) for path in other_paths]
+        for path, future in futures:
             try:
-                original = Image.open(path).convert('RGB')
-                # Apply committed transforms, producing the pre-adjustment base.
-                adj_base = self._replay_ops(original, transform_ops)
-                # Apply current slider values on top to get the final result.
-                result = adj_base.copy()
-                if b != 1.0:
-                    result = ImageEnhance.Brightness(result).enhance(b)
-                if c != 1.0:
-                    result = ImageEnhance.Contrast(result).enhance(c)
-                if s != 1.0:
-                    result = ImageEnhance.Sharpness(result).enhance(s)
+                original, adj_base, result = future.result()
 
                 stored_ops = list(transform_ops)
                 if has_sliders:
@@ -724,7 +778,7 @@ class ImageModificationPage(QWidget):
                     'pre_filter_adjustment_base': None,
                     'active_filter': None,
                     'modified_image': None,
-                    'history': [result.copy()],
+                    'history': [result],
                     'history_index': 0,
                     'brightness': int(b * 100),
                     'contrast': int(c * 100),
@@ -743,7 +797,6 @@ class ImageModificationPage(QWidget):
 
     def _replay_ops(self, img, ops):
         """Replay a list of recorded operations on a PIL image."""
-        img = img.copy()
         for op in ops:
             kind = op[0]
             if kind == "rotate":
@@ -757,7 +810,7 @@ class ImageModificationPage(QWidget):
             elif kind == "adjust":
                 b, c, s = op[1], op[2], op[3]
                 if b != 1.0:
-                    img = ImageEnhance.Brightness(img).enhance(b)
+                    img = enhance_brightness(img, b)
                 if c != 1.0:
                     img = ImageEnhance.Contrast(img).enhance(c)
                 if s != 1.0:
@@ -770,20 +823,41 @@ class ImageModificationPage(QWidget):
     # Image loading
     # ------------------------------------------------------------------ #
 
+    def _open_rgb(self, path):
+        """
+        Return the image at path as RGB, decoding it only if it is not cached.
+
+        Decoded images are kept per (path, mtime), so a file edited on disk is
+        read again. The cached image itself is returned; like every image on
+        this page it is never modified in place.
+        """
+        key = (path, os.path.getmtime(path))
+        with self._decode_lock:
+            cached = self._decode_cache.get(key)
+            if cached is not None:
+                self._decode_cache.move_to_end(key)
+        if cached is None:
+            cached = Image.open(path).convert('RGB')
+            with self._decode_lock:
+                self._decode_cache[key] = cached
+                if len(self._decode_cache) > DECODE_CACHE_SIZE:
+                    self._decode_cache.popitem(last=False)
+        return cached
+
     def load_image(self, image_path):
         """Load a fresh image from disk."""
         try:
             self.image_path = image_path
-            self.original_image = Image.open(image_path).convert('RGB')
-            self.current_image = self.original_image.copy()
-            self.adjustment_base = self.original_image.copy()
+            self.original_image = self._open_rgb(image_path)
+            self.current_image = self.original_image
+            self.adjustment_base = self.original_image
             self.pre_filter_adjustment_base = None
             self.pre_filter_image = None
             self.active_filter = None
             self.modified_image = None
             self._applied_ops = []
 
-            self.history = [self.current_image.copy()]
+            self.history = [self.current_image]
             self.history_index = 0
 
             width, height = self.current_image.size
@@ -809,6 +883,12 @@ class ImageModificationPage(QWidget):
     # ------------------------------------------------------------------ #
 
     def display_image(self, pil_image):
+        # Box-reduce by the whole part of the display scale first, so only an
+        # image at most twice the display size is copied into Qt and smoothed
+        max_w, max_h = self.max_display_size
+        factor = int(max(pil_image.width / max_w, pil_image.height / max_h))
+        if factor >= 2:
+            pil_image = pil_image.reduce(factor)
         img_array = np.array(pil_image)
         height, width, _ = img_array.shape
         bytes_per_line = 3 * width
@@ -816,7 +896,7 @@ class ImageModificationPage(QWidget):
             img_array.data, width, height, bytes_per_line, QImage.Format.Format_RGB888
         )
         pixmap = QPixmap.fromImage(q_image)
-        max_size = QSize(self.max_display_size[0], self.max_display_size[1])
+        max_size = QSize(max_w, max_h)
         scaled = pixmap.scaled(
             max_size,
             Qt.AspectRatioMode.KeepAspectRatio,
@@ -831,7 +911,7 @@ class ImageModificationPage(QWidget):
 
     def add_to_history(self, image):
         self.history = self.history[:self.history_index + 1]
-        self.history.append(image.copy())
+        self.history.append(image)
         self.history_index += 1
         if len(self.history) > 50:
             self.history.pop(0)
@@ -929,9 +1009,9 @@ class ImageModificationPage(QWidget):
         self.sharpness_value.setText(f"{s:.1f}")
 
         try:
-            preview = self.adjustment_base.copy()
+            preview = self.adjustment_base
             if b != 1.0:
-                preview = ImageEnhance.Brightness(preview).enhance(b)
+                preview = enhance_brightness(preview, b)
             if c != 1.0:
                 preview = ImageEnhance.Contrast(preview).enhance(c)
             if s != 1.0:
@@ -944,7 +1024,7 @@ class ImageModificationPage(QWidget):
     def apply_adjustments(self):
         """Commit slider values to current_image. Sliders stay in place."""
         if self.modified_image:
-            self.current_image = self.modified_image.copy()
+            self.current_image = self.modified_image
             self.add_to_history(self.current_image)
             b = self.brightness_slider.value() / 100.0
             c = self.contrast_slider.value() / 100.0
@@ -978,47 +1058,30 @@ class ImageModificationPage(QWidget):
     def _apply_pil_filter(self, image, filter_name, params=None):
         if params is None:
             params = self._get_current_filter_params(filter_name)
-        filtered = image.copy()
+        filtered = image
         if filter_name == "Gaussian Blur":
             filtered = filtered.filter(ImageFilter.GaussianBlur(radius=params.get("radius", 2)))
         elif filter_name == "Box Blur":
             filtered = filtered.filter(ImageFilter.BoxBlur(radius=params.get("radius", 2)))
         elif filter_name == "Motion Blur":
-            arr = np.array(filtered, dtype=np.float32)
+            # Horizontal box mean over a zero-padded window (same alignment as
+            # np.convolve mode='same'), for all rows and channels at once:
+            # window sums come from one integer running sum along each row
             ks = params.get("kernel_size", 15)
-            kernel = np.ones(ks) / ks
-            for ch in range(arr.shape[2]):
-                for row in range(arr.shape[0]):
-                    arr[row, :, ch] = np.convolve(arr[row, :, ch], kernel, mode='same')
-            filtered = Image.fromarray(arr.clip(0, 255).astype(np.uint8))
+            arr = np.asarray(filtered)
+            padded = np.pad(arr, ((0, 0), (ks // 2 + 1, (ks - 1) // 2), (0, 0)))
+            sums = np.cumsum(padded, axis=1, dtype=np.int32)
+            filtered = Image.fromarray(((sums[:, ks:] - sums[:, :-ks]) // ks).astype(np.uint8))
         elif filter_name == "Median":
             filtered = filtered.filter(ImageFilter.MedianFilter(size=params.get("size", 3)))
-        elif filter_name == "Blur":
-            filtered = filtered.filter(ImageFilter.BLUR)
-        elif filter_name == "Sharpen":
-            filtered = filtered.filter(ImageFilter.SHARPEN)
         elif filter_name == "Unsharp Mask":
             filtered = filtered.filter(ImageFilter.UnsharpMask(
                 radius=params.get("radius", 2),
                 percent=params.get("percent", 150),
                 threshold=params.get("threshold", 3),
             ))
-        elif filter_name == "Edge Enhance":
-            filtered = filtered.filter(ImageFilter.EDGE_ENHANCE)
-        elif filter_name == "Edge Enhance More":
-            filtered = filtered.filter(ImageFilter.EDGE_ENHANCE_MORE)
-        elif filter_name == "Find Edges":
-            filtered = filtered.filter(ImageFilter.FIND_EDGES)
-        elif filter_name == "Emboss":
-            filtered = filtered.filter(ImageFilter.EMBOSS)
-        elif filter_name == "Contour":
-            filtered = filtered.filter(ImageFilter.CONTOUR)
-        elif filter_name == "Detail":
-            filtered = filtered.filter(ImageFilter.DETAIL)
-        elif filter_name == "Smooth":
-            filtered = filtered.filter(ImageFilter.SMOOTH)
-        elif filter_name == "Smooth More":
-            filtered = filtered.filter(ImageFilter.SMOOTH_MORE)
+        elif filter_name in FIXED_FILTERS:
+            filtered = filtered.filter(FIXED_FILTERS[filter_name])
         return filtered
 
     def apply_filter(self):
@@ -1030,10 +1093,10 @@ class ImageModificationPage(QWidget):
 
         if filter_name == "None":
             if self.pre_filter_image is not None:
-                self.current_image = self.pre_filter_image.copy()
+                self.current_image = self.pre_filter_image
                 self.pre_filter_image = None
                 if self.pre_filter_adjustment_base is not None:
-                    self.adjustment_base = self.pre_filter_adjustment_base.copy()
+                    self.adjustment_base = self.pre_filter_adjustment_base
                     self.pre_filter_adjustment_base = None
                 self.active_filter = None
                 self.add_to_history(self.current_image)
@@ -1045,9 +1108,9 @@ class ImageModificationPage(QWidget):
 
         try:
             if self.pre_filter_image is None:
-                self.pre_filter_image = self.current_image.copy()
+                self.pre_filter_image = self.current_image
             if self.pre_filter_adjustment_base is None:
-                self.pre_filter_adjustment_base = self.adjustment_base.copy()
+                self.pre_filter_adjustment_base = self.adjustment_base
 
             params = self._get_current_filter_params(filter_name)
             self.current_image = self._apply_pil_filter(self.pre_filter_image, filter_name, params)
@@ -1094,8 +1157,8 @@ class ImageModificationPage(QWidget):
     def undo(self):
         if self.history_index > 0:
             self.history_index -= 1
-            self.current_image = self.history[self.history_index].copy()
-            self.adjustment_base = self.current_image.copy()
+            self.current_image = self.history[self.history_index]
+            self.adjustment_base = self.current_image
             self.display_image(self.current_image)
             self.update_info()
             self.status_label.setText("Undo")
@@ -1105,8 +1168,8 @@ class ImageModificationPage(QWidget):
     def redo(self):
         if self.history_index < len(self.history) - 1:
             self.history_index += 1
-            self.current_image = self.history[self.history_index].copy()
-            self.adjustment_base = self.current_image.copy()
+            self.current_image = self.history[self.history_index]
+            self.adjustment_base = self.current_image
             self.display_image(self.current_image)
             self.update_info()
             self.status_label.setText("Redo")
@@ -1126,14 +1189,14 @@ class ImageModificationPage(QWidget):
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
         )
         if reply == QMessageBox.StandardButton.Yes:
-            self.current_image = self.original_image.copy()
-            self.adjustment_base = self.original_image.copy()
+            self.current_image = self.original_image
+            self.adjustment_base = self.original_image
             self.pre_filter_adjustment_base = None
             self.pre_filter_image = None
             self.active_filter = None
             self.modified_image = None
             self._applied_ops = []
-            self.history = [self.current_image.copy()]
+            self.history = [self.current_image]
             self.history_index = 0
 
             for slider in (self.brightness_slider, self.contrast_slider, self.sharpness_slider):
@@ -313,10 +313,13 @@ class AnalysisSetupTab(QWidget):
         the images come from the Upload tab.
         """
         self.selected_folder = folder
-        n = len([
-            f for f in os.listdir(folder)
-            if f.lower().endswith(('.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tiff', '.webp'))
-        ])
+        # Count in one scandir pass; is_file() uses the cached entry type
+        with os.scandir(folder) as entries:
+            n = sum(
+                1 for entry in entries
+                if entry.is_file()
+                and entry.name.lower().endswith(('.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tiff', '.webp'))
+            )
         self.upload_source_label.setText(f"✓ Using {n} image(s) from Upload tab")
         self.upload_source_label.setVisible(True)
         self.status_label.setText("")
@@ -4,48 +4,127 @@ Results Tab - Display processing results and analysis data
 
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
                              QFrame, QScrollArea, QSizePolicy, QPushButton,
-                             QTableWidget, QTableWidgetItem, QFileDialog, QHeaderView,
+                             QTableView, QFileDialog, QHeaderView,
                              QMessageBox, QSplitter, QTextEdit, QComboBox, QSpinBox,
                              QGroupBox, QGridLayout, QTabWidget)
-from PySide6.QtCore import Qt, QSize, QStandardPaths, QDir
-from PySide6.QtGui import QPixmap, QImage, QColor, QBrush, QFont
+from PySide6.QtCore import (Qt, QSize, QStandardPaths, QDir, QAbstractTableModel, QModelIndex,
+                            QObject, QRunnable, QThreadPool, QTimer, Signal)
+from PySide6.QtGui import QPixmap, QPixmapCache, QImage, QImageReader, QColor, QBrush
 
 import pandas as pd
 import numpy as np
 import os
-import re
+
+try:
+    import pyarrow  # noqa: F401 -- optional, only used as a faster CSV engine
+    HAVE_PYARROW = True
+except ImportError:
+    HAVE_PYARROW = False
+
+
+# Similarity colour bins: < 0.4, [0.4, 0.6), [0.6, 0.8), >= 0.8
+# (models keep bin indices as uint8, one byte per cell)
+SIMILARITY_BINS = np.array([0.4, 0.6, 0.8])
+BIN_BRUSHES = (
+    QBrush(QColor(255, 182, 193)),
+    QBrush(QColor(255, 218, 185)),
+    QBrush(QColor(255, 255, 224)),
+    QBrush(QColor(144, 238, 144)),
+)
+# (text, background) colours of the comparison score for the same bins
+SCORE_COLORS = (
+    ("#991b1b", "#fee2e2"),
+    ("#9a3412", "#fff7ed"),
+    ("#854d0e", "#fefce8"),
+    ("#166534", "#dcfce7"),
+)
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp', '.gif')
+
+# Largest side a loaded heatmap is kept at; bigger files are downscaled on load
+HEATMAP_MAX_SIZE = 2048
+
+# Similarity CSVs above this size are read in chunks of about CSV_CHUNK_CELLS values
+LARGE_CSV_BYTES = 200 * 1024 * 1024
+CSV_CHUNK_CELLS = 10_000_000
+
+# Source images are named grey_obj<object number><view letter>.jpg
+OBJECT_NAME_PATTERN = r'^grey_obj(\d+)[a-l]\.jpg'
+
+
+# Section frame styling, applied once by ResultsTab. The descendant rule keeps
+# the frame look on child frames (labels, tables) just as the former
+# per-section QFrame stylesheet did; the title rule is more specific, so its
+# properties are layered on top of the frame ones.
+SECTION_QSS = """
+    QFrame#sectionFrame, QFrame#sectionFrame QFrame {
+        background-color: #f8f9fa;
+        border: 1px solid #e0e0e0;
+        border-radius: 8px;
+        padding: 15px;
+        margin: 10px 0;
+    }
+    QFrame#sectionFrame QLabel#sectionTitle {
+        font-size: 16px;
+        font-weight: bold;
+        color: #2c3e50;
+        margin-bottom: 10px;
+        border-bottom: 1px solid #e0e0e0;
+        padding-bottom: 5px;
+    }
+"""
+
+
+# Result table styling, parsed once when each table is built. Cell text colour
+# comes from here rather than a per-cell ForegroundRole.
+MATRIX_TABLE_QSS = """
+    QTableView {
+        color: #000000;
+    }
+    QHeaderView::section:horizontal {
+        background-color: #2c3e50;
+        color: white;
+        font-weight: bold;
+        font-size: 9pt;
+        padding: 4px;
+        border: 1px solid #34495e;
+    }
+    QHeaderView::section:vertical {
+        background-color: #e8edf2;
+        color: #2c3e50;
+        font-weight: bold;
+        font-size: 9pt;
+        padding: 2px 6px;
+        border: 1px solid #d1d5db;
+    }
+"""
+MATCHES_TABLE_QSS = """
+    QTableView {
+        color: #000000;
+    }
+    QHeaderView::section {
+        background-color: #e8edf2;
+        color: #2c3e50;
+        font-weight: bold;
+        padding: 4px 6px;
+        border: 1px solid #d1d5db;
+    }
+"""
 
 
 class SectionWidget(QFrame):
-    """Reusable section widget with title and content"""
+    """Reusable section widget with title and content (styled by SECTION_QSS)"""
     def __init__(self, title, parent=None):
         super().__init__(parent)
         self.setFrameStyle(QFrame.StyledPanel | QFrame.Raised)
-        self.setStyleSheet("""
-            QFrame {
-                background-color: #f8f9fa;
-                border: 1px solid #e0e0e0;
-                border-radius: 8px;
-                padding: 15px;
-                margin: 10px 0;
-            }
-        """)
+        self.setObjectName("sectionFrame")
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(5, 5, 5, 5)
 
         # Section title
         title_label = QLabel(title)
-        title_label.setStyleSheet("""
-            QLabel {
-                font-size: 16px;
-                font-weight: bold;
-                color: #2c3e50;
-                margin-bottom: 10px;
-                border-bottom: 1px solid #e0e0e0;
-                padding-bottom: 5px;
-            }
-        """)
+        title_label.setObjectName("sectionTitle")
         layout.addWidget(title_label)
 
         # Content container
@@ -55,6 +134,336 @@ class SectionWidget(QFrame):
         layout.addWidget(self.content)
 
 
+def read_similarity_csv(path):
+    """Read a similarity matrix CSV (image names in the first column) as float32"""
+    # Very large files are streamed into one preallocated array instead
+    if os.path.getsize(path) > LARGE_CSV_BYTES:
+        return _read_similarity_csv_chunked(path)
+
+    # pyarrow's multithreaded parser is faster on large matrices when it is
+    # installed. It infers the float columns quicker than it applies a
+    # per-column dtype map, so cast afterwards. Otherwise (or if it rejects
+    # the file) use the C parser.
+    if HAVE_PYARROW:
+        try:
+            return _row_major_frame(pd.read_csv(path, index_col=0, engine='pyarrow'))
+        except (ValueError, TypeError):
+            pass
+
+    # Read the header alone first so every data column can be typed up front,
+    # skipping dtype inference while keeping the name column as strings
+    columns = pd.read_csv(path, nrows=0).columns
+    dtypes = {name: np.float32 for name in columns[1:]}
+    return _row_major_frame(pd.read_csv(path, index_col=0, engine='c', dtype=dtypes,
+                                        float_precision='high', memory_map=True))
+
+
+def _row_major_frame(frame):
+    """
+    Return the frame backed by one row-major float32 array.
+
+    Parsed frames hold their columns as one column-major block, so to_numpy()
+    would be a view with strided rows. The row and upper-triangle gathers
+    want contiguous rows, so the values are reordered once, here.
+    """
+    if (frame.dtypes == np.float32).all() and frame.to_numpy().flags.c_contiguous:
+        return frame
+    values = frame.to_numpy(dtype=np.float32)
+    return pd.DataFrame(np.ascontiguousarray(values), index=frame.index,
+                        columns=frame.columns, copy=False)
+
+
+def _read_similarity_csv_chunked(path):
+    """
+    Read a large similarity CSV in row chunks into a single float32 array.
+
+    The matrix is expected to be square, so the column count gives the row
+    count to preallocate; the buffer still grows if the file has more rows.
+    """
+    columns = pd.read_csv(path, nrows=0).columns[1:]
+    dtypes = {name: np.float32 for name in columns}
+    n_cols = len(columns)
+    # Keep each chunk around CSV_CHUNK_CELLS values however wide the matrix is
+    chunk_rows = max(1, CSV_CHUNK_CELLS // max(n_cols, 1))
+
+    values = np.empty((n_cols, n_cols), dtype=np.float32)
+    names = []
+    index_name = None
+    offset = 0
+    reader = pd.read_csv(path, index_col=0, engine='c', dtype=dtypes,
+                         float_precision='high', chunksize=chunk_rows)
+    with reader:
+        for chunk in reader:
+            stop = offset + len(chunk)
+            if stop > values.shape[0]:
+                grown = np.empty((max(stop, 2 * values.shape[0]), n_cols), dtype=np.float32)
+                grown[:offset] = values[:offset]
+                values = grown
+            values[offset:stop] = chunk.to_numpy()
+            names.extend(chunk.index)
+            index_name = chunk.index.name
+            offset = stop
+
+    return pd.DataFrame(values[:offset], index=pd.Index(names, name=index_name), columns=columns)
+
+
+def find_result_files(results_dir):
+    """
+    Pick the similarity CSV and heatmap image in a results directory.
+
+    Prefers a CSV with 'similarity' and an image with 'heatmap' in its name,
+    falling back to the first CSV / image found. Each name is classified in a
+    single directory pass. Returns (csv_name, image_name); either may be None.
+    """
+    first_csv = similarity_csv = None
+    first_image = heatmap_image = None
+    with os.scandir(results_dir) as entries:
+        for entry in entries:
+            name = entry.name
+            lower = name.lower()
+            if name.endswith('.csv'):
+                first_csv = first_csv or name
+                if similarity_csv is None and 'similarity' in lower:
+                    similarity_csv = name
+            elif lower.endswith(IMAGE_EXTENSIONS):
+                first_image = first_image or name
+                if heatmap_image is None and 'heatmap' in lower:
+                    heatmap_image = name
+    return similarity_csv or first_csv, heatmap_image or first_image
+
+
+def display_name(name):
+    """Strip the image extension from a filename for display"""
+    return name.replace('.jpg', '').replace('.png', '')
+
+
+def display_names(names):
+    """Vectorized display_name over a sequence of names; returns an object ndarray"""
+    labels = pd.Index(names).astype(str)
+    return labels.str.replace('.jpg', '', regex=False).str.replace('.png', '', regex=False).to_numpy()
+
+
+def scaled_image_pixmap(path, width, height):
+    """
+    Return the image at path smoothly scaled to fit width x height.
+
+    The image is decoded straight at the target size, which lets the JPEG
+    reader downsample during decoding instead of producing a full-resolution
+    image first. Results are kept in the application-wide QPixmapCache keyed
+    by path and size, so re-selecting a pair does not decode its images again.
+    Returns a null QPixmap if the file cannot be loaded.
+    """
+    key = f"{path}|{width}x{height}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None:
+        reader = QImageReader(path)
+        source_size = reader.size()
+        if source_size.isValid():
+            reader.setScaledSize(source_size.scaled(width, height, Qt.AspectRatioMode.KeepAspectRatio))
+        image = reader.read()
+        if image.isNull():
+            return QPixmap()
+        pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+class SimilarityModel(QAbstractTableModel):
+    """
+    Read-only table model over a similarity matrix.
+
+    Cell text and colours are produced on demand in data(), so the view only
+    ever materialises the cells that are actually visible.
+    """
+
+    def __init__(self, values, row_names, col_names, parent=None):
+        super().__init__(parent)
+        self._arr = values
+        self._bins = np.digitize(self._arr, SIMILARITY_BINS).astype(np.uint8)
+        self._row_names = row_names
+        self._col_names = col_names
+        self._row_labels = display_names(row_names).tolist()
+        self._col_labels = display_names(col_names).tolist()
+
+    def pair_at(self, index):
+        """Return the (row image, column image) filenames for a model index"""
+        return self._row_names[index.row()], self._col_names[index.column()]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._arr.shape[0]
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._arr.shape[1]
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return f"{self._arr[index.row(), index.column()]:.4f}"
+        if role == Qt.ItemDataRole.BackgroundRole:
+            return BIN_BRUSHES[self._bins[index.row(), index.column()]]
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignCenter
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self._col_labels[section]
+        return self._row_labels[section]
+
+
+class MatchesModel(QAbstractTableModel):
+    """
+    Read-only table model over the selected image pairs in Top Matches.
+
+    Names, similarities and colour bins are kept as arrays; sorting reorders
+    them in place rather than rebuilding any items.
+    """
+
+    HEADERS = ('Image 1', 'Image 2', 'Similarity')
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.set_matches([], [], [])
+
+    def set_matches(self, img1, img2, similarities):
+        """Replace the listed pairs"""
+        self.beginResetModel()
+        self._img1 = np.asarray(img1, dtype=object)
+        self._img2 = np.asarray(img2, dtype=object)
+        self._sims = np.asarray(similarities, dtype=np.float32)
+        self._bins = np.digitize(self._sims, SIMILARITY_BINS).astype(np.uint8)
+        self._sim_texts = np.char.mod('%.4f', self._sims)
+        self._labels = (
+            display_names(self._img1),
+            display_names(self._img2),
+        )
+        self.endResetModel()
+
+    def pair_at(self, row):
+        """Return the (image 1, image 2) filenames listed in a row"""
+        return self._img1[row], self._img2[row]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._sims)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        row, col = index.row(), index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            if col == 2:
+                return str(self._sim_texts[row])
+            return self._labels[col][row]
+        if role == Qt.ItemDataRole.BackgroundRole and col == 2:
+            return BIN_BRUSHES[self._bins[row]]
+        if role == Qt.ItemDataRole.TextAlignmentRole and col == 2:
+            return Qt.AlignmentFlag.AlignCenter
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return section + 1
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        """Sort rows by a column; similarities compare as numbers, ties keep their order"""
+        descending = order == Qt.SortOrder.DescendingOrder
+        if column == 2:
+            perm = np.argsort(-self._sims if descending else self._sims, kind='stable')
+        else:
+            keys = self._labels[column]
+            perm = np.array(sorted(range(len(keys)), key=keys.__getitem__, reverse=descending),
+                            dtype=np.intp)
+
+        self.layoutAboutToBeChanged.emit()
+        self._img1, self._img2 = self._img1[perm], self._img2[perm]
+        self._sims, self._bins = self._sims[perm], self._bins[perm]
+        self._sim_texts = self._sim_texts[perm]
+        self._labels = (self._labels[0][perm], self._labels[1][perm])
+
+        # Keep selections and other persistent indexes on the same pairs
+        new_rows = np.empty_like(perm)
+        new_rows[perm] = np.arange(len(perm))
+        old_indexes = self.persistentIndexList()
+        self.changePersistentIndexList(
+            old_indexes,
+            [self.index(int(new_rows[i.row()]), i.column()) for i in old_indexes]
+        )
+        self.layoutChanged.emit()
+
+
+class LoadSignals(QObject):
+    """Signals used by ResultsLoadTask to hand results back to the GUI thread"""
+    finished = Signal(object)  # emits the result dict built in ResultsLoadTask.run
+
+
+class ResultsLoadTask(QRunnable):
+    """
+    Background task that parses a similarity CSV and/or decodes a heatmap image.
+
+    The heatmap is decoded into a QImage, which is safe to create off the GUI
+    thread; the receiver converts it to a QPixmap on the GUI thread.
+    """
+
+    def __init__(self, csv_path=None, image_path=None, generation=0):
+        super().__init__()
+        self.csv_path = csv_path
+        self.image_path = image_path
+        self.generation = generation
+        self.signals = LoadSignals()
+
+    def run(self):
+        result = {
+            'task': self,
+            'generation': self.generation,
+            'csv_path': self.csv_path,
+            'data': None,
+            'csv_error': None,
+            'image_path': self.image_path,
+            'image': None,
+            'image_error': None,
+        }
+
+        if self.csv_path:
+            try:
+                result['data'] = read_similarity_csv(self.csv_path)
+            except Exception as e:
+                result['csv_error'] = str(e)
+
+        if self.image_path:
+            image = QImage(self.image_path)
+            if image.isNull():
+                result['image_error'] = "Could not load image file"
+            else:
+                # Match the raster engine's native formats so neither the
+                # smooth scale nor QPixmap.fromImage has to convert again
+                if image.hasAlphaChannel():
+                    image.convertTo(QImage.Format.Format_ARGB32_Premultiplied)
+                else:
+                    image.convertTo(QImage.Format.Format_RGB32)
+                # Downscale oversized heatmaps once here so every later
+                # display scale starts from at most HEATMAP_MAX_SIZE pixels a side
+                if image.width() > HEATMAP_MAX_SIZE or image.height() > HEATMAP_MAX_SIZE:
+                    image = image.scaled(
+                        QSize(HEATMAP_MAX_SIZE, HEATMAP_MAX_SIZE),
+                        Qt.AspectRatioMode.KeepAspectRatio,
+                        Qt.TransformationMode.SmoothTransformation
+                    )
+                result['image'] = image
+
+        self.signals.finished.emit(result)
+
+
 class ResultsTab(QWidget):
     """
     Results tab widget for displaying processing results
@@ -69,6 +478,28 @@ class ResultsTab(QWidget):
         self.image_folder = None      # Directory where source images live
         self.selected_img1 = None     # Currently selected image filenames
         self.selected_img2 = None
+        self.max_display_dim = 200    # Largest matrix window shown in the Full Matrix tab
+        self._stats_cache = None      # Cached intra/inter-object statistics
+        self._cross_cache = None      # Cached mask of the cross-object entries of _pairs
+        self._obj_ids = None          # Object number per matrix row (-1 if unknown)
+        self._pos = {}                # Image name -> matrix row position
+        self._col_pos = {}            # Image name -> matrix column position
+        self._pairs = None            # Similarity of every upper-triangle (i < j) pair
+        self._symmetric = False       # Whether the lower triangle mirrors _pairs
+        self._pending_loads = set()   # Background load tasks still running
+        self._load_generation = 0     # Stamp of the most recently started load
+        self._csv_generation = 0      # Stamp of the newest load that reads a CSV
+        self._image_generation = 0    # Stamp of the newest load that reads a heatmap
+        self._tab_built = [False] * 3 # Result tabs filled for the current data
+        self._scaled_cache = None     # (label size, scaled heatmap pixmap) of the last scale
+
+        # Smooth-rescale the heatmap once resizing settles; until then a fast
+        # nearest-neighbour preview is shown
+        self._smooth_timer = QTimer(self)
+        self._smooth_timer.setSingleShot(True)
+        self._smooth_timer.setInterval(100)
+        self._smooth_timer.timeout.connect(self._smooth_scale_heatmap)
+
         self.setup_ui()
 
     def setup_ui(self):
@@ -77,6 +508,9 @@ class ResultsTab(QWidget):
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(15, 15, 15, 15)
 
+        # One stylesheet for every section instead of one per SectionWidget
+        self.setStyleSheet(SECTION_QSS)
+
         # Create scroll area
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
@@ -123,6 +557,30 @@ class ResultsTab(QWidget):
         self.stats_placeholder = QLabel("Image statistics will be displayed here")
         self.stats_placeholder.setStyleSheet("color: #6b7280; font-style: italic;")
         self.stats_section.content_layout.addWidget(self.stats_placeholder)
+
+        # Metric labels are created once; update_statistics only changes their text
+        self.stats_grid = QFrame()
+        self.stats_grid.setStyleSheet("""
+            QLabel {
+                background: transparent;
+                border: none;
+                padding: 0px;
+                margin: 0px;
+            }
+        """)
+        stats_grid_layout = QGridLayout(self.stats_grid)
+        stats_grid_layout.setContentsMargins(5, 5, 5, 5)
+        self.stat_labels = {}
+        stat_names = [
+            "Mean", "Std", "Range", "Matrix Size", "Unique Pairs",
+            "Objects Detected", "Intra-Object Mean ± Std", "Intra-Object Pairs",
+            "Inter-Object Mean ± Std", "Inter-Object Pairs",
+        ]
+        for i, name in enumerate(stat_names):
+            metric, self.stat_labels[name] = self._create_metric_widget(name, "—")
+            stats_grid_layout.addWidget(metric, i // 5, i % 5)
+        self.stats_grid.setVisible(False)
+        self.stats_section.content_layout.addWidget(self.stats_grid)
         scroll_layout.addWidget(self.stats_section)
 
         # 3. Analysis Results Section - Using tabs for organization
@@ -201,8 +659,45 @@ class ResultsTab(QWidget):
         self.matrix_info_label.setStyleSheet("color: #6b7280; font-style: italic; margin-bottom: 10px;")
         matrix_tab_layout.addWidget(self.matrix_info_label)
 
-        self.similarity_table = QTableWidget()
+        # Page control — only shown when the matrix exceeds max_display_dim
+        self.matrix_page_controls = QWidget()
+        matrix_page_layout = QHBoxLayout(self.matrix_page_controls)
+        matrix_page_layout.setContentsMargins(0, 0, 0, 10)
+
+        # Rows and columns page independently, so every block of the matrix
+        # (not only the diagonal ones) can be reached
+        rows_from_label = QLabel("Rows from image:")
+        rows_from_label.setStyleSheet("color: #374151; font-weight: bold;")
+        matrix_page_layout.addWidget(rows_from_label)
+        self.matrix_row_spinner = QSpinBox()
+        self.matrix_row_spinner.setMinimum(1)
+        self.matrix_row_spinner.valueChanged.connect(self.show_matrix_window)
+        matrix_page_layout.addWidget(self.matrix_row_spinner)
+
+        cols_from_label = QLabel("Columns from image:")
+        cols_from_label.setStyleSheet("color: #374151; font-weight: bold;")
+        matrix_page_layout.addWidget(cols_from_label)
+        self.matrix_col_spinner = QSpinBox()
+        self.matrix_col_spinner.setMinimum(1)
+        self.matrix_col_spinner.valueChanged.connect(self.show_matrix_window)
+        matrix_page_layout.addWidget(self.matrix_col_spinner)
+        matrix_page_layout.addStretch()
+
+        self.matrix_page_controls.hide()
+        matrix_tab_layout.addWidget(self.matrix_page_controls)
+
+        self.similarity_table = QTableView()
         self.similarity_table.setMinimumSize(600, 400)
+        self.similarity_table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
+        self.similarity_table.setStyleSheet(MATRIX_TABLE_QSS)
+        matrix_header = self.similarity_table.horizontalHeader()
+        matrix_header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        matrix_header.setDefaultSectionSize(72)
+        matrix_header.setMinimumSectionSize(60)
+        matrix_header.setMinimumHeight(28)
+        # Every row holds the same single-line text, so row heights never need
+        # to be measured or tracked per section
+        self.similarity_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
         matrix_tab_layout.addWidget(self.similarity_table)
         self.results_tabs.addTab(matrix_tab, "Full Matrix")
 
@@ -231,8 +726,17 @@ class ResultsTab(QWidget):
         matches_controls_layout.addStretch()
         matches_tab_layout.addWidget(matches_controls)
 
-        self.matches_table = QTableWidget()
+        self.matches_table = QTableView()
+        self.matches_model = MatchesModel(self.matches_table)
+        self.matches_table.setModel(self.matches_model)
         self.matches_table.setMinimumSize(600, 350)
+        self.matches_table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
+        self.matches_table.setStyleSheet(MATCHES_TABLE_QSS)
+        mh_header = self.matches_table.horizontalHeader()
+        mh_header.setMinimumHeight(26)
+        mh_header.setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.matches_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.matches_table.setSortingEnabled(True)
         matches_tab_layout.addWidget(self.matches_table)
 
         self.results_tabs.addTab(matches_tab, "Top Matches")
@@ -399,8 +903,11 @@ class ResultsTab(QWidget):
         scroll_layout.addWidget(self.export_section)
 
         # Connect table cell clicks to image comparison
-        self.similarity_table.cellClicked.connect(self.on_matrix_cell_clicked)
-        self.matches_table.cellClicked.connect(self.on_matches_row_clicked)
+        self.similarity_table.clicked.connect(self.on_matrix_cell_clicked)
+        self.matches_table.clicked.connect(self.on_matches_row_clicked)
+
+        # Matrix and match tabs are filled on first visit
+        self.results_tabs.currentChanged.connect(self.on_results_tab_changed)
 
         # Add stretch to push content to top
         scroll_layout.addStretch()
@@ -410,7 +917,7 @@ class ResultsTab(QWidget):
         main_layout.addWidget(scroll)
 
     def _create_metric_widget(self, name, value):
-        """Helper to create a metric display widget"""
+        """Helper to create a metric display widget; returns (container, value label)"""
         container = QWidget()
         layout = QVBoxLayout(container)
         layout.setContentsMargins(5, 5, 5, 5)
@@ -430,7 +937,7 @@ class ResultsTab(QWidget):
         layout.addWidget(name_label)
         layout.addWidget(value_label)
 
-        return container
+        return container, value_label
 
     def _create_comparison_box(self, title):
         """Helper to create a comparison box"""
@@ -464,6 +971,65 @@ class ResultsTab(QWidget):
 
         return container
 
+    def _start_load(self, on_finished, csv_path=None, image_path=None):
+        """Parse/decode result files on the thread pool and call on_finished with the result"""
+        # Loads can finish out of order; stamp each one so the slots can drop
+        # results that a newer request of the same kind has superseded
+        self._load_generation += 1
+        if csv_path:
+            self._csv_generation = self._load_generation
+        if image_path:
+            self._image_generation = self._load_generation
+        task = ResultsLoadTask(csv_path, image_path, self._load_generation)
+        task.signals.finished.connect(on_finished)
+        self._pending_loads.add(task)
+        QThreadPool.globalInstance().start(task)
+
+    def _set_similarity_data(self, data):
+        """Store a newly loaded similarity matrix and drop anything derived from the old one"""
+        # Similarities live in [0, 1]; float32 is plenty and halves every pass over the matrix
+        self.similarity_data = _row_major_frame(data)
+        self._pos = {name: i for i, name in enumerate(self.similarity_data.index)}
+        self._col_pos = {name: j for j, name in enumerate(self.similarity_data.columns)}
+
+        # Object number of every image, parsed once (-1 when the name has none)
+        obj_nums = self.similarity_data.index.to_series().str.extract(OBJECT_NAME_PATTERN, expand=False)
+        self._obj_ids = pd.to_numeric(obj_nums).fillna(-1).astype(np.int32).to_numpy()
+
+        # A row-major view of the values, so no second copy of the matrix is kept
+        matrix = self.similarity_data.to_numpy()
+        n_rows, n_cols = matrix.shape
+
+        # Top-k and the intra/inter statistics rank each (i, j) pair with i < j,
+        # so extract the upper triangle once. Only the values are kept; the
+        # positions are rebuilt on demand by _pair_positions, since two index
+        # arrays would cost four times as much memory as the float32 values
+        upper = np.arange(n_rows)[:, None] < np.arange(n_cols)
+        self._pairs = matrix[upper]
+        # Compare the upper triangle with the mirrored lower one rather than
+        # the whole matrix with its transpose (no N x N float temporaries)
+        self._symmetric = n_rows == n_cols and np.allclose(
+            self._pairs, matrix.T[upper], equal_nan=True
+        )
+        self._stats_cache = None
+        self._cross_cache = None
+
+    def _set_heatmap_image(self, image, path):
+        """Store a decoded heatmap QImage as the displayed heatmap"""
+        self.heatmap_image = QPixmap.fromImage(image)
+        self.heatmap_image_path = path
+        self._scaled_cache = None
+        # Restyle once per load; display_heatmap runs on every resize
+        self.heatmap_label.setStyleSheet("""
+            QLabel {
+                background-color: #ffffff;
+                border: 1px solid #d1d5db;
+                border-radius: 8px;
+                padding: 5px;
+            }
+        """)
+        self.display_heatmap()
+
     def load_similarity_csv(self):
         """Load similarity data from CSV file"""
         file_path, _ = QFileDialog.getOpenFileName(
@@ -474,13 +1040,24 @@ class ResultsTab(QWidget):
         )
 
         if file_path:
-            try:
-                self.similarity_data = pd.read_csv(file_path, index_col=0)
-                self.display_similarity_table()
-                self.update_statistics()
-                QMessageBox.information(self, "Success", f"Loaded similarity data from {os.path.basename(file_path)}")
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to load CSV file: {str(e)}")
+            self._start_load(self._on_csv_file_loaded, csv_path=file_path)
+
+    def _on_csv_file_loaded(self, result):
+        """Finish load_similarity_csv once the CSV has been parsed"""
+        self._pending_loads.discard(result['task'])
+        if result['generation'] != self._csv_generation:
+            return
+        if result['csv_error']:
+            QMessageBox.critical(self, "Error", f"Failed to load CSV file: {result['csv_error']}")
+            return
+
+        try:
+            self._set_similarity_data(result['data'])
+            self.display_similarity_table()
+            self.update_statistics()
+            QMessageBox.information(self, "Success", f"Loaded similarity data from {os.path.basename(result['csv_path'])}")
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to load CSV file: {str(e)}")
 
     def load_heatmap_image(self):
         """Load heatmap image file"""
@@ -492,61 +1069,64 @@ class ResultsTab(QWidget):
         )
 
         if file_path:
-            try:
-                pixmap = QPixmap(file_path)
-                if not pixmap.isNull():
-                    self.heatmap_image = pixmap
-                    self.heatmap_image_path = file_path
-                    self.display_heatmap()
-                    QMessageBox.information(self, "Success", f"Loaded heatmap from {os.path.basename(file_path)}")
-                else:
-                    QMessageBox.warning(self, "Warning", "Could not load image file")
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to load image: {str(e)}")
+            self._start_load(self._on_heatmap_file_loaded, image_path=file_path)
+
+    def _on_heatmap_file_loaded(self, result):
+        """Finish load_heatmap_image once the image has been decoded"""
+        self._pending_loads.discard(result['task'])
+        if result['generation'] != self._image_generation:
+            return
+        if result['image_error']:
+            QMessageBox.warning(self, "Warning", result['image_error'])
+            return
+
+        try:
+            self._set_heatmap_image(result['image'], result['image_path'])
+            QMessageBox.information(self, "Success", f"Loaded heatmap from {os.path.basename(result['image_path'])}")
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to load image: {str(e)}")
 
     def load_from_directory(self, results_dir):
         """Load results directly from a given directory path (called after analysis completes)."""
         if not os.path.exists(results_dir):
             return
 
-        all_files = os.listdir(results_dir)
+        target_csv, target_image = find_result_files(results_dir)
 
-        csv_files = [f for f in all_files if f.endswith('.csv')]
-        similarity_csvs = [f for f in csv_files if 'similarity' in f.lower()]
-        target_csv = similarity_csvs[0] if similarity_csvs else (csv_files[0] if csv_files else None)
+        # Auto-set image folder to the parent of results_dir (where source images live)
+        source_dir = os.path.dirname(results_dir)
+        if os.path.isdir(source_dir):
+            self.image_folder = source_dir
+            if hasattr(self, 'comp_folder_label'):
+                self.comp_folder_label.setText(f"Image folder: {source_dir}")
+                self.comp_folder_label.setStyleSheet("color: #374151; font-size: 11px;")
 
-        if target_csv:
+        if target_csv or target_image:
+            self._start_load(
+                self._on_directory_loaded,
+                csv_path=os.path.join(results_dir, target_csv) if target_csv else None,
+                image_path=os.path.join(results_dir, target_image) if target_image else None,
+            )
+
+    def _on_directory_loaded(self, result):
+        """Finish load_from_directory; failures are silently skipped"""
+        self._pending_loads.discard(result['task'])
+        csv_current = result['generation'] == self._csv_generation
+        image_current = result['generation'] == self._image_generation
+        if result['data'] is not None and csv_current:
             try:
-                self.similarity_data = pd.read_csv(os.path.join(results_dir, target_csv), index_col=0)
+                self._set_similarity_data(result['data'])
                 self.display_similarity_table()
             except Exception:
                 pass
 
-        image_extensions = ['.png', '.jpg', '.jpeg', '.bmp', '.gif']
-        image_files = [f for f in all_files if any(f.lower().endswith(ext) for ext in image_extensions)]
-        heatmap_images = [f for f in image_files if 'heatmap' in f.lower()]
-        target_image = heatmap_images[0] if heatmap_images else (image_files[0] if image_files else None)
-
-        if target_image:
+        if result['image'] is not None and image_current:
             try:
-                img_full_path = os.path.join(results_dir, target_image)
-                pixmap = QPixmap(img_full_path)
-                if not pixmap.isNull():
-                    self.heatmap_image = pixmap
-                    self.heatmap_image_path = img_full_path
-                    self.display_heatmap()
+                self._set_heatmap_image(result['image'], result['image_path'])
             except Exception:
                 pass
 
-        # Auto-set image folder to the parent of results_dir (where source images live)
-        source_dir = os.path.dirname(results_dir)
-        if os.path.isdir(source_dir):
-            self.image_folder = source_dir
-            if hasattr(self, 'comp_folder_label'):
-                self.comp_folder_label.setText(f"Image folder: {source_dir}")
-                self.comp_folder_label.setStyleSheet("color: #374151; font-size: 11px;")
-
-        if self.similarity_data is not None:
+        if csv_current and self.similarity_data is not None:
             self.update_statistics()
 
     def auto_load_results(self):
@@ -557,39 +1137,43 @@ class ResultsTab(QWidget):
             QMessageBox.warning(self, "Warning", f"Results directory not found: {results_dir}")
             return
 
-        loaded_files = []
-        all_files = os.listdir(results_dir)
+        target_csv, target_image = find_result_files(results_dir)
 
-        # Look for similarity CSV files - prefer files with 'similarity' in the name
-        csv_files = [f for f in all_files if f.endswith('.csv')]
-        similarity_csvs = [f for f in csv_files if 'similarity' in f.lower()]
-        target_csv = similarity_csvs[0] if similarity_csvs else (csv_files[0] if csv_files else None)
+        if not target_csv and not target_image:
+            QMessageBox.information(self, "Info", "No results files found in the results directory")
+            return
+
+        self._start_load(
+            self._on_auto_loaded,
+            csv_path=os.path.join(results_dir, target_csv) if target_csv else None,
+            image_path=os.path.join(results_dir, target_image) if target_image else None,
+        )
+
+    def _on_auto_loaded(self, result):
+        """Finish auto_load_results and report what was loaded"""
+        self._pending_loads.discard(result['task'])
+        csv_current = result['generation'] == self._csv_generation
+        image_current = result['generation'] == self._image_generation
+        if not csv_current and not image_current:
+            return
+        loaded_files = []
 
-        if target_csv:
-            csv_path = os.path.join(results_dir, target_csv)
+        if result['csv_path'] and csv_current:
+            target_csv = os.path.basename(result['csv_path'])
             try:
-                self.similarity_data = pd.read_csv(csv_path, index_col=0)
+                if result['csv_error']:
+                    raise ValueError(result['csv_error'])
+                self._set_similarity_data(result['data'])
                 self.display_similarity_table()
                 loaded_files.append(f"{target_csv} (similarity data)")
             except Exception as e:
                 QMessageBox.warning(self, "Warning", f"Failed to load {target_csv}: {str(e)}")
 
-        # Look for heatmap image files - prefer files with 'heatmap' in the name
-        image_extensions = ['.png', '.jpg', '.jpeg', '.bmp', '.gif']
-        image_files = [f for f in all_files
-                      if any(f.lower().endswith(ext) for ext in image_extensions)]
-        heatmap_images = [f for f in image_files if 'heatmap' in f.lower()]
-        target_image = heatmap_images[0] if heatmap_images else (image_files[0] if image_files else None)
-
-        if target_image:
-            img_path = os.path.join(results_dir, target_image)
+        if result['image'] is not None and image_current:
+            target_image = os.path.basename(result['image_path'])
             try:
-                pixmap = QPixmap(img_path)
-                if not pixmap.isNull():
-                    self.heatmap_image = pixmap
-                    self.heatmap_image_path = img_path
-                    self.display_heatmap()
-                    loaded_files.append(f"{target_image} (heatmap)")
+                self._set_heatmap_image(result['image'], result['image_path'])
+                loaded_files.append(f"{target_image} (heatmap)")
             except Exception as e:
                 QMessageBox.warning(self, "Warning", f"Failed to load {target_image}: {str(e)}")
 
@@ -644,17 +1228,10 @@ class ResultsTab(QWidget):
                 QMessageBox.critical(self, "Error", f"Failed to save heatmap: {str(e)}")
 
     def display_similarity_table(self):
-        """Display similarity data in the table widget"""
+        """Display similarity data in the matrix table view"""
         if self.similarity_data is None:
             return
 
-        # Update matrix info label
-        num_images = len(self.similarity_data)
-        self.matrix_info_label.setText(
-            f"Matrix size: {num_images} x {num_images} | "
-            f"Total comparisons: {num_images * num_images:,} | "
-            f"Unique pairs: {num_images * (num_images - 1) // 2:,}"
-        )
         self.matrix_info_label.setStyleSheet("""
             QLabel {
                 color: #374151;
@@ -666,206 +1243,203 @@ class ResultsTab(QWidget):
             }
         """)
 
-        # Hide both Qt headers — row and column labels live in data cells instead
-        self.similarity_table.verticalHeader().hide()
-        self.similarity_table.horizontalHeader().hide()
-
-        n_rows = len(self.similarity_data)
-        n_cols = len(self.similarity_data.columns)
-
-        # +1 row for the column-label header row (row 0)
-        self.similarity_table.setRowCount(n_rows + 1)
-        self.similarity_table.setColumnCount(n_cols + 1)
-
-        col_labels = [c.replace('.jpg', '').replace('.png', '') for c in self.similarity_data.columns]
-
-        header_font = QFont()
-        header_font.setBold(True)
-        header_font.setPointSize(9)
-
-        # Row 0: column label cells styled as a header
-        corner = QTableWidgetItem("")
-        corner.setBackground(QBrush(QColor(44, 62, 80)))
-        corner.setFlags(Qt.ItemFlag.ItemIsEnabled)
-        self.similarity_table.setItem(0, 0, corner)
-        for j, label_text in enumerate(col_labels):
-            ch = QTableWidgetItem(label_text)
-            ch.setBackground(QBrush(QColor(44, 62, 80)))
-            ch.setForeground(QBrush(QColor(255, 255, 255)))
-            ch.setFont(header_font)
-            ch.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            ch.setFlags(Qt.ItemFlag.ItemIsEnabled)
-            self.similarity_table.setItem(0, j + 1, ch)
-        self.similarity_table.setRowHeight(0, 28)
-
-        label_font = QFont()
-        label_font.setBold(True)
-        label_font.setPointSize(9)
-
-        for i, row_name in enumerate(self.similarity_data.index):
-            data_row = i + 1  # row 0 is the column-label row
-            # Column 0: inline row label
-            display_name = row_name.replace('.jpg', '').replace('.png', '')
-            label_item = QTableWidgetItem(display_name)
-            label_item.setBackground(QBrush(QColor(232, 237, 242)))
-            label_item.setForeground(QBrush(QColor(44, 62, 80)))
-            label_item.setFont(label_font)
-            label_item.setTextAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft)
-            label_item.setFlags(Qt.ItemFlag.ItemIsEnabled)
-            self.similarity_table.setItem(data_row, 0, label_item)
-
-            # Columns 1..N: similarity values
-            for j, col_name in enumerate(self.similarity_data.columns):
-                value = self.similarity_data.iloc[i, j]
-                item = QTableWidgetItem(f"{value:.4f}")
-
-                if isinstance(value, (int, float)):
-                    if value >= 0.8:
-                        item.setBackground(QBrush(QColor(144, 238, 144)))
-                    elif value >= 0.6:
-                        item.setBackground(QBrush(QColor(255, 255, 224)))
-                    elif value >= 0.4:
-                        item.setBackground(QBrush(QColor(255, 218, 185)))
-                    else:
-                        item.setBackground(QBrush(QColor(255, 182, 193)))
-
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                item.setForeground(QBrush(QColor(0, 0, 0)))
-                self.similarity_table.setItem(data_row, j + 1, item)
-
-        # Column sizing
-        header = self.similarity_table.horizontalHeader()
-        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
-        header.setDefaultSectionSize(72)
-        header.setMinimumSectionSize(60)
-        header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
-
-        # Make table read-only
-        self.similarity_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        # Large matrices are paged through a max_display_dim window
+        n_rows, n_cols = self.similarity_data.shape
+        paged = max(n_rows, n_cols) > self.max_display_dim
+        # Block valueChanged while resetting the spinners so the window is built once below
+        for spinner, count in ((self.matrix_row_spinner, n_rows), (self.matrix_col_spinner, n_cols)):
+            spinner.blockSignals(True)
+            spinner.setMaximum(max(1, count - self.max_display_dim + 1))
+            spinner.setSingleStep(self.max_display_dim)
+            spinner.setValue(1)
+            spinner.blockSignals(False)
+        self.matrix_page_controls.setVisible(paged)
 
         # Extract object groups for statistics
         self.extract_object_groups()
 
-        # Update analysis views
-        self.update_top_matches()
+        # Analysis views are rebuilt when their tab is next shown
+        self._tab_built = [False] * self.results_tabs.count()
+        self.on_results_tab_changed(self.results_tabs.currentIndex())
+
+    def on_results_tab_changed(self, index):
+        """Fill a result tab the first time it is shown for the current data"""
+        if self.similarity_data is None or index < 0 or self._tab_built[index]:
+            return
+
+        self._tab_built[index] = True
+        if index == 1:
+            self.show_matrix_window()
+        elif index == 2:
+            self.update_top_matches()
+
+    def show_matrix_window(self):
+        """Show the block of the matrix starting at the row and column page spinners' images"""
+        if self.similarity_data is None:
+            return
+
+        num_images = len(self.similarity_data)
+        n_cols = self.similarity_data.shape[1]
+        row_start = self.matrix_row_spinner.value() - 1
+        row_stop = min(row_start + self.max_display_dim, num_images)
+        col_start = self.matrix_col_spinner.value() - 1
+        col_stop = min(col_start + self.max_display_dim, n_cols)
+        # Plain positional slices of the stored arrays; no pandas indexing needed
+        window = self.similarity_data.to_numpy()[row_start:row_stop, col_start:col_stop]
+        row_names = self.similarity_data.index[row_start:row_stop]
+        col_names = self.similarity_data.columns[col_start:col_stop]
+
+        info = (
+            f"Matrix size: {num_images} x {num_images} | "
+            f"Total comparisons: {num_images * num_images:,} | "
+            f"Unique pairs: {num_images * (num_images - 1) // 2:,}"
+        )
+        if max(num_images, n_cols) > self.max_display_dim:
+            info += (f" | Showing rows {row_start + 1}–{row_stop}, "
+                     f"columns {col_start + 1}–{col_stop} of {num_images}")
+        self.matrix_info_label.setText(info)
+
+        # The model formats cells lazily, so only the visible viewport is rendered
+        old_model = self.similarity_table.model()
+        old_selection = self.similarity_table.selectionModel()
+        self.similarity_table.setUpdatesEnabled(False)
+        self.similarity_table.setModel(
+            SimilarityModel(window, row_names, col_names, self.similarity_table)
+        )
+        self.similarity_table.setUpdatesEnabled(True)
+        if old_model is not None:
+            old_model.deleteLater()
+        if old_selection is not None:
+            old_selection.deleteLater()
 
     def display_heatmap(self):
         """Display the heatmap image"""
         if self.heatmap_image is None:
             return
 
-        # Scale image to fit while maintaining aspect ratio
+        # Scale image to fit while maintaining aspect ratio. The smooth resample
+        # is reused while the label size is unchanged; otherwise show a fast
+        # preview now and schedule the smooth pass
+        target = self.heatmap_label.size()
+        if self._scaled_cache is not None and self._scaled_cache[0] == target:
+            self.heatmap_label.setPixmap(self._scaled_cache[1])
+        else:
+            self.heatmap_label.setPixmap(self.heatmap_image.scaled(
+                target,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.FastTransformation
+            ))
+            self._smooth_timer.start()
+
+    def _smooth_scale_heatmap(self):
+        """Replace the fast heatmap preview with a smooth scale at the current size"""
+        if self.heatmap_image is None:
+            return
+
+        target = self.heatmap_label.size()
         scaled_pixmap = self.heatmap_image.scaled(
-            self.heatmap_label.size(),
+            target,
             Qt.AspectRatioMode.KeepAspectRatio,
             Qt.TransformationMode.SmoothTransformation
         )
+        self._scaled_cache = (target, scaled_pixmap)
         self.heatmap_label.setPixmap(scaled_pixmap)
-        self.heatmap_label.setStyleSheet("""
-            QLabel {
-                background-color: #ffffff;
-                border: 1px solid #d1d5db;
-                border-radius: 8px;
-                padding: 5px;
-            }
-        """)
 
     def update_statistics(self):
         """Update the statistics section with data from similarity matrix"""
         if self.similarity_data is None:
             return
 
-        # Calculate overall statistics
-        data_values = self.similarity_data.values.copy()
-        np.fill_diagonal(data_values, np.nan)  # Exclude diagonal (self-similarity)
-
-        mean_similarity = np.nanmean(data_values)
-        max_similarity = np.nanmax(data_values)
-        min_similarity = np.nanmin(data_values)
-        std_similarity = np.nanstd(data_values)
-
-        # Calculate intra vs inter object statistics if object groups exist
-        intra_stats = ""
-        inter_stats = ""
-        if self.object_groups:
-            intra_values = []
-            inter_values = []
-
-            for obj_key, images in self.object_groups.items():
-                # Intra-object comparisons
-                for i, img1 in enumerate(images):
-                    for j, img2 in enumerate(images):
-                        if i < j:
-                            intra_values.append(self.similarity_data.loc[img1, img2])
-
-            # Inter-object comparisons
-            obj_keys = list(self.object_groups.keys())
-            for i, obj1 in enumerate(obj_keys):
-                for j, obj2 in enumerate(obj_keys):
-                    if i < j:
-                        for img1 in self.object_groups[obj1]:
-                            for img2 in self.object_groups[obj2]:
-                                inter_values.append(self.similarity_data.loc[img1, img2])
-
-            if intra_values:
-                intra_mean = np.mean(intra_values)
-                intra_std = np.std(intra_values)
-                intra_stats = f"""
-<br><b>Intra-Object (same object views):</b><br>
-• Mean: {intra_mean:.4f} | Std: {intra_std:.4f}<br>
-• Count: {len(intra_values):,} pairs"""
-
-            if inter_values:
-                inter_mean = np.mean(inter_values)
-                inter_std = np.std(inter_values)
-                inter_stats = f"""
-<br><b>Inter-Object (different objects):</b><br>
-• Mean: {inter_mean:.4f} | Std: {inter_std:.4f}<br>
-• Count: {len(inter_values):,} pairs"""
-
-        num_objects = len(self.object_groups) if self.object_groups else "N/A"
-
-        # Update statistics display
-        stats_text = f"""
-<b>Overall Similarity Statistics:</b><br>
-• Mean: {mean_similarity:.4f} | Std: {std_similarity:.4f}<br>
-• Range: [{min_similarity:.4f}, {max_similarity:.4f}]<br>
-• Matrix Size: {self.similarity_data.shape[0]} × {self.similarity_data.shape[1]}<br>
-• Unique Pairs: {self.similarity_data.shape[0] * (self.similarity_data.shape[0] - 1) // 2:,}<br>
-• Objects Detected: {num_objects}
-{intra_stats}
-{inter_stats}
-        """
-
-        self.stats_placeholder.setText(stats_text)
-        self.stats_placeholder.setStyleSheet("""
-            QLabel {
-                color: #374151;
-                background-color: #f9fafb;
-                border: 1px solid #e5e7eb;
-                border-radius: 6px;
-                padding: 12px;
-                font-size: 13px;
-                line-height: 1.4;
-            }
-        """)
+        # Calculate overall statistics excluding self-similarity. A symmetric
+        # matrix holds each pair twice, so its upper triangle is enough;
+        # otherwise every off-diagonal cell counts
+        if self._symmetric:
+            pairs = self._pairs
+        else:
+            matrix = self.similarity_data.to_numpy()
+            pairs = matrix[~np.eye(*matrix.shape, dtype=bool)]
+
+        if pairs.size:
+            # The std reuses the mean and one deviation buffer (a single dot
+            # product) instead of np.std re-deriving the mean with its own temporaries
+            mean_similarity = pairs.mean(dtype=np.float64)
+            deviations = pairs - mean_similarity
+            std_similarity = np.sqrt(np.dot(deviations, deviations) / pairs.size)
+            max_similarity = pairs.max()
+            min_similarity = pairs.min()
+        else:
+            mean_similarity = max_similarity = min_similarity = std_similarity = np.nan
+
+        n_rows, n_cols = self.similarity_data.shape
+        labels = self.stat_labels
+        labels["Mean"].setText(f"{mean_similarity:.4f}")
+        labels["Std"].setText(f"{std_similarity:.4f}")
+        labels["Range"].setText(f"[{min_similarity:.4f}, {max_similarity:.4f}]")
+        labels["Matrix Size"].setText(f"{n_rows} × {n_cols}")
+        labels["Unique Pairs"].setText(f"{n_rows * (n_rows - 1) // 2:,}")
+        labels["Objects Detected"].setText(str(len(self.object_groups)) if self.object_groups else "N/A")
+
+        # Intra vs inter object statistics if object groups exist
+        group_stats = self._compute_group_stats() if self.object_groups else None
+        for kind, prefix in (("intra", "Intra-Object"), ("inter", "Inter-Object")):
+            if group_stats and group_stats[f'{kind}_count']:
+                labels[f"{prefix} Mean ± Std"].setText(
+                    f"{group_stats[f'{kind}_mean']:.4f} ± {group_stats[f'{kind}_std']:.4f}"
+                )
+                labels[f"{prefix} Pairs"].setText(f"{group_stats[f'{kind}_count']:,}")
+            else:
+                labels[f"{prefix} Mean ± Std"].setText("—")
+                labels[f"{prefix} Pairs"].setText("—")
+
+        self.stats_placeholder.setVisible(False)
+        self.stats_grid.setVisible(True)
+
+    def _compute_group_stats(self):
+        """Return intra/inter-object pair counts and their summary stats (cached)"""
+        if self._stats_cache is not None:
+            return self._stats_cache
+
+        # Label every distinct pair by the objects of its two images in one pass
+        rows, cols = self._pair_positions()
+        obj1 = self._obj_ids[rows]
+        obj2 = self._obj_ids[cols]
+        known = (obj1 >= 0) & (obj2 >= 0)
+        same = obj1 == obj2
+
+        # Per-kind counts, sums and squared deviations via bincount, instead of
+        # gathering each kind into its own array and reducing it separately.
+        # Kind 0 = pair with an unknown object, 1 = intra-object, 2 = inter-object
+        kind = np.where(known, np.where(same, 1, 2), 0)
+        values = self._pairs.astype(np.float64)
+        counts = np.bincount(kind, minlength=3)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = np.bincount(kind, weights=values, minlength=3) / counts
+            stds = np.sqrt(np.bincount(kind, weights=(values - means[kind]) ** 2, minlength=3) / counts)
+
+        self._stats_cache = {
+            'intra_count': int(counts[1]),
+            'inter_count': int(counts[2]),
+            'intra_mean': means[1],
+            'intra_std': stds[1],
+            'inter_mean': means[2],
+            'inter_std': stds[2],
+        }
+        return self._stats_cache
 
     def extract_object_groups(self):
         """Extract object groupings from image filenames"""
         if self.similarity_data is None:
             return
 
-        self.object_groups = {}
-        pattern = re.compile(r'grey_obj(\d+)[a-l]\.jpg')
-
-        for name in self.similarity_data.index:
-            match = pattern.match(name)
-            if match:
-                obj_num = match.group(1)
-                obj_key = f"Object {obj_num}"
-                if obj_key not in self.object_groups:
-                    self.object_groups[obj_key] = []
-                self.object_groups[obj_key].append(name)
+        # Group names by the object numbers parsed when the data was stored.
+        # The intra/inter statistics depend only on those ids and the pair
+        # values, so _stats_cache stays valid until _set_similarity_data runs.
+        names = self.similarity_data.index.to_series()
+        matched = self._obj_ids >= 0
+        self.object_groups = {
+            f"Object {obj_id}": list(images)
+            for obj_id, images in names[matched].groupby(self._obj_ids[matched], sort=False)
+        }
 
     def update_top_matches(self):
         """Update the top matches table based on current selection"""
@@ -875,91 +1449,79 @@ class ResultsTab(QWidget):
         n = self.top_n_spinner.value()
         match_type = self.match_type_combo.currentText()
 
-        # Get all pairs
-        pairs = []
-        for i, row in enumerate(self.similarity_data.index):
-            for j, col in enumerate(self.similarity_data.columns):
-                if i < j:  # Only upper triangle (avoid duplicates and self-comparison)
-                    pairs.append({
-                        'Image 1': row,
-                        'Image 2': col,
-                        'Similarity': self.similarity_data.iloc[i, j],
-                        'Same Object': self._same_object(row, col)
-                    })
-
-        df_pairs = pd.DataFrame(pairs)
-
-        if match_type == "Most Similar":
-            df_pairs = df_pairs.nlargest(n, 'Similarity')
-        elif match_type == "Least Similar":
-            df_pairs = df_pairs.nsmallest(n, 'Similarity')
-        elif match_type == "Cross-Object Similar":
-            # Most similar pairs from different objects
-            cross_obj = df_pairs[~df_pairs['Same Object']]
-            df_pairs = cross_obj.nlargest(n, 'Similarity')
+        # Distinct pairs were extracted at load (no duplicates, no self-comparison)
+        pairs = self._pairs
+        k = min(n, pairs.size)
 
-        # Display in table
-        mh_header = self.matches_table.horizontalHeader()
-        mh_header.setVisible(True)
-        mh_header.setMinimumHeight(26)
-        self.matches_table.setStyleSheet("""
-            QHeaderView::section {
-                background-color: #e8edf2;
-                color: #2c3e50;
-                font-weight: bold;
-                padding: 4px 6px;
-                border: 1px solid #d1d5db;
-            }
-        """)
-        self.matches_table.setRowCount(len(df_pairs))
-        self.matches_table.setColumnCount(3)
-        header_font = QFont()
-        header_font.setBold(True)
-        for j, text in enumerate(['Image 1', 'Image 2', 'Similarity']):
-            h_item = QTableWidgetItem(text)
-            h_item.setForeground(QBrush(QColor(44, 62, 80)))
-            h_item.setFont(header_font)
-            self.matches_table.setHorizontalHeaderItem(j, h_item)
-
-        def strip_ext(name):
-            return name.replace('.jpg', '').replace('.png', '')
-
-        for i, (_, row) in enumerate(df_pairs.iterrows()):
-            img1_item = QTableWidgetItem(strip_ext(row['Image 1']))
-            img1_item.setForeground(QBrush(QColor(0, 0, 0)))
-            self.matches_table.setItem(i, 0, img1_item)
-
-            img2_item = QTableWidgetItem(strip_ext(row['Image 2']))
-            img2_item.setForeground(QBrush(QColor(0, 0, 0)))
-            self.matches_table.setItem(i, 1, img2_item)
-
-            sim_item = QTableWidgetItem(f"{row['Similarity']:.4f}")
-            sim_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-
-            # Color code similarity
-            if row['Similarity'] >= 0.8:
-                sim_item.setBackground(QBrush(QColor(144, 238, 144)))
-            elif row['Similarity'] >= 0.6:
-                sim_item.setBackground(QBrush(QColor(255, 255, 224)))
-            elif row['Similarity'] >= 0.4:
-                sim_item.setBackground(QBrush(QColor(255, 218, 185)))
-            else:
-                sim_item.setBackground(QBrush(QColor(255, 182, 193)))
-            sim_item.setForeground(QBrush(QColor(0, 0, 0)))
-
-            self.matches_table.setItem(i, 2, sim_item)
+        if match_type == "Cross-Object Similar":
+            # Most similar pairs from different objects: same-object pairs sink
+            # to -inf so they can never be ranked, and indices stay valid for _pairs
+            cross = self._cross_object_mask()
+            pairs = np.where(cross, pairs, -np.inf)
+            k = min(n, np.count_nonzero(cross))
 
-        self.matches_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-        self.matches_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        # Partition out the top k, then sort only those k
+        if k == 0:
+            top_idx = np.empty(0, dtype=np.intp)
+        elif match_type == "Least Similar":
+            top_idx = np.sort(np.argpartition(pairs, k - 1)[:k])
+            top_idx = top_idx[np.argsort(pairs[top_idx], kind='stable')]
+        else:
+            top_idx = np.sort(np.argpartition(pairs, pairs.size - k)[-k:])
+            top_idx = top_idx[np.argsort(-pairs[top_idx], kind='stable')]
+
+        # Only the k winners need their matrix positions
+        top_rows, top_cols = self._pair_positions(top_idx)
+
+        # Stay in plain ndarrays all the way into the model
+        img1_names = self.similarity_data.index.to_numpy()[top_rows]
+        img2_names = self.similarity_data.columns.to_numpy()[top_cols]
+        similarities = pairs[top_idx]
+
+        self.matches_model.set_matches(img1_names, img2_names, similarities)
+
+        # Show the sort indicator for the ranking order the rows are already in.
+        # Header signals are blocked so the view does not re-sort the new rows.
+        order = (Qt.SortOrder.AscendingOrder if match_type == "Least Similar"
+                 else Qt.SortOrder.DescendingOrder)
+        header = self.matches_table.horizontalHeader()
+        header.blockSignals(True)
+        header.setSortIndicator(2, order)
+        header.blockSignals(False)
+
+    def _cross_object_mask(self):
+        """Return a mask of the _pairs whose images are from different objects (cached)"""
+        if self._cross_cache is None:
+            # Object ids were parsed once per load (-1 when a name has no object number)
+            rows, cols = self._pair_positions()
+            obj1 = self._obj_ids[rows]
+            obj2 = self._obj_ids[cols]
+            self._cross_cache = (obj1 < 0) | (obj2 < 0) | (obj1 != obj2)
+        return self._cross_cache
+
+    def _pair_positions(self, idx=None):
+        """Return the (row, col) matrix positions of _pairs, or of _pairs[idx] only"""
+        n_rows, n_cols = self.similarity_data.shape
+        if idx is None:
+            return np.triu_indices(n_rows, k=1, m=n_cols)
+
+        # Row i holds the pairs (i, i+1 .. n_cols-1), stored back to back;
+        # find each index's row from the offsets at which the rows start
+        counts = np.clip(n_cols - np.arange(n_rows) - 1, 0, None)
+        starts = np.concatenate(([0], np.cumsum(counts)))
+        rows = np.searchsorted(starts, idx, side='right') - 1
+        return rows, idx - starts[rows] + rows + 1
 
     def _same_object(self, img1, img2):
-        """Check if two images are from the same object"""
-        pattern = re.compile(r'grey_obj(\d+)[a-l]\.jpg')
-        match1 = pattern.match(img1)
-        match2 = pattern.match(img2)
-        if match1 and match2:
-            return match1.group(1) == match2.group(1)
-        return False
+        """Check if two images (filenames or matrix row positions) are from the same object"""
+        if isinstance(img1, str):
+            img1 = self._pos.get(img1)
+        if isinstance(img2, str):
+            img2 = self._pos.get(img2)
+        if img1 is None or img2 is None:
+            return False
+        obj1, obj2 = self._obj_ids[img1], self._obj_ids[img2]
+        return obj1 >= 0 and obj1 == obj2
 
     # ------------------------------------------------------------------
     # Image comparison helpers
@@ -999,71 +1561,30 @@ class ResultsTab(QWidget):
                     return path
         return None
 
-    def on_matrix_cell_clicked(self, row, col):
-        """Handle a click in the Full Matrix or Compare Objects table.
-
-        Row 0 is the column-label header row; column 0 holds the row label.
-        Clicking either is ignored; only data cells (row > 0, col > 0) select a pair.
-        """
-        if self.similarity_data is None or row == 0 or col == 0:
-            return
-
-        # Determine which table sent the signal
-        table = self.sender()
-
-        row_label_item = table.item(row, 0)
-        col_header_item = table.item(0, col)  # column name lives in the header row
-        if row_label_item is None or col_header_item is None:
+    def on_matrix_cell_clicked(self, index):
+        """Handle a click in the Full Matrix table — select that image pair."""
+        if self.similarity_data is None or not index.isValid():
             return
 
-        # Display names have .jpg stripped; restore it for lookup
-        img1 = row_label_item.text()
-        img2 = col_header_item.text()
-        if not img1.endswith(('.jpg', '.png')):
-            img1 += '.jpg'
-        if not img2.endswith(('.jpg', '.png')):
-            img2 += '.jpg'
-
-        self.selected_img1 = img1
-        self.selected_img2 = img2
+        self.selected_img1, self.selected_img2 = self.similarity_table.model().pair_at(index)
         self.update_comparison_display()
 
-    def on_matches_row_clicked(self, row, _col):
+    def on_matches_row_clicked(self, index):
         """Handle a click in the Top Matches table — select that pair."""
-        if self.similarity_data is None:
-            return
-
-        img1_item = self.matches_table.item(row, 0)
-        img2_item = self.matches_table.item(row, 1)
-        if img1_item is None or img2_item is None:
+        if self.similarity_data is None or not index.isValid():
             return
 
-        img1 = img1_item.text()
-        img2 = img2_item.text()
-        if not img1.endswith(('.jpg', '.png')):
-            img1 += '.jpg'
-        if not img2.endswith(('.jpg', '.png')):
-            img2 += '.jpg'
-
-        self.selected_img1 = img1
-        self.selected_img2 = img2
+        self.selected_img1, self.selected_img2 = self.matches_model.pair_at(index.row())
         self.update_comparison_display()
 
     def update_comparison_display(self):
         """Load and display the two selected images in the comparison section."""
         def load_into(label, name_label, filename):
-            display = filename.replace('.jpg', '').replace('.png', '')
-            name_label.setText(display)
+            name_label.setText(display_name(filename))
             path = self._find_image_file(filename)
             if path:
-                pixmap = QPixmap(path)
-                if not pixmap.isNull():
-                    scaled = pixmap.scaled(
-                        label.width() or 220,
-                        label.height() or 180,
-                        Qt.AspectRatioMode.KeepAspectRatio,
-                        Qt.TransformationMode.SmoothTransformation,
-                    )
+                scaled = scaled_image_pixmap(path, label.width() or 220, label.height() or 180)
+                if not scaled.isNull():
                     label.setPixmap(scaled)
                     label.setStyleSheet("""
                         QLabel {
@@ -1092,20 +1613,16 @@ class ResultsTab(QWidget):
         color = "#1f2937"
         bg = "#f9fafb"
         if self.similarity_data is not None:
-            # Try to look up the score; both the original .jpg names are index keys
-            try:
-                score = self.similarity_data.loc[self.selected_img1, self.selected_img2]
-                score_text = f"{score:.4f}"
-                if score >= 0.8:
-                    color, bg = "#166534", "#dcfce7"
-                elif score >= 0.6:
-                    color, bg = "#854d0e", "#fefce8"
-                elif score >= 0.4:
-                    color, bg = "#9a3412", "#fff7ed"
-                else:
-                    color, bg = "#991b1b", "#fee2e2"
-            except KeyError:
+            # Look up the score by position in the NumPy copy; both the original
+            # .jpg names are index keys
+            row = self._pos.get(self.selected_img1)
+            col = self._col_pos.get(self.selected_img2)
+            if row is None or col is None:
                 score_text = "N/A"
+            else:
+                score = self.similarity_data.to_numpy()[row, col]
+                score_text = f"{score:.4f}"
+                color, bg = SCORE_COLORS[np.digitize(score, SIMILARITY_BINS)]
 
         self.comp_score_label.setText(score_text)
         self.comp_score_label.setStyleSheet(f"""